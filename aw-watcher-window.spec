@@ -8,7 +8,12 @@ a = Analysis(
     binaries=[("aw_watcher_window/aw-watcher-window-macos", "aw_watcher_window")] if platform.system() == "Darwin" else [],
     datas=[
         ("aw_watcher_window/printAppStatus.jxa", "aw_watcher_window"),
-    ],
+    ]
+    + (
+        [("aw_watcher_window/printAppStatus.scpt", "aw_watcher_window")]
+        if platform.system() == "Darwin"
+        else []
+    ),
     hiddenimports=[],
     hookspath=[],
     runtime_hooks=[],
@@ -1,6 +1,10 @@
 import argparse
+import os
+from functools import lru_cache
+from typing import Optional
 
 from aw_core.config import load_config_toml
+from aw_core.dirs import get_config_dir
 
 default_config = """
 [aw-watcher-window]
@@ -11,10 +15,36 @@ strategy_macos = "swift"
 
 
 def load_config():
+    # Key the cache on the config file's mtime so we only re-read and
+    # re-parse the TOML when the file has actually changed.
+    config_dir = get_config_dir("aw-watcher-window")
+    config_file_path = os.path.join(config_dir, "aw-watcher-window.toml")
+    try:
+        mtime: Optional[int] = os.stat(config_file_path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    return _load_config_cached(config_file_path, mtime)
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(config_file_path: str, mtime: Optional[int]):
     return load_config_toml("aw-watcher-window", default_config)["aw-watcher-window"]
 
 
+_parsed_args: Optional[argparse.Namespace] = None
+
+
 def parse_args():
+    # Parse at most once per process; repeat calls return the same Namespace
+    # without re-reading the config or rebuilding the parser.
+    global _parsed_args
+    if _parsed_args is None:
+        _parsed_args = _build_parser().parse_args()
+    return _parsed_args
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
     config = load_config()
 
     default_poll_time = config["poll_time"]
@@ -41,8 +71,7 @@ def parse_args():
         "--strategy",
         dest="strategy",
         default=default_strategy_macos,
-        choices=["jxa", "applescript", "swift"],
+        choices=["jxa", "ax", "applescript", "swift"],
         help="(macOS only) strategy to use for retrieving the active window",
     )
-    parsed_args = parser.parse_args()
-    return parsed_args
+    return parser
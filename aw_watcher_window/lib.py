@@ -27,6 +27,11 @@ def get_current_window_macos(strategy: str) -> Optional[dict]:
         from . import macos_jxa
 
         return macos_jxa.getInfo()
+    elif strategy == "ax":
+        # direct Accessibility API calls, no AppleEvents round-trip (but no url)
+        from . import macos_ax
+
+        return macos_ax.getInfo()
     elif strategy == "applescript":
         from . import macos_applescript
 
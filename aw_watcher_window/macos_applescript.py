@@ -14,9 +14,14 @@ tell application "System Events"
     set frontAppName to name of frontApp
     tell process frontAppName
         try
-            tell (1st window whose value of attribute "AXMain" is true)
-                set windowTitle to value of attribute "AXTitle"
-            end tell
+            -- iterate explicitly instead of a `whose` filter, which can take
+            -- several seconds on some macOS versions
+            repeat with w in windows
+                if value of attribute "AXMain" of w is true then
+                    set windowTitle to value of attribute "AXTitle" of w
+                    exit repeat
+                end if
+            end repeat
         end try
     end tell
 end tell
@@ -40,23 +45,15 @@ def getInfo() -> Dict[str, str]:
         raise Exception(errorinfo)
     output = result.stringValue()
 
-    # Ensure there's no extra newlines in the output
-    assert len(output.split("\n")) == 2
+    # Single pass over the output instead of splitting once per field
+    app, sep, title = output.partition("\n")
 
-    app = getApp(output)
-    title = getTitle(output)
+    # Ensure there's no extra newlines in the output
+    assert sep and "\n" not in title
 
     return {"app": app, "title": title}
 
 
-def getApp(info: str) -> str:
-    return info.split('\n')[0]
-
-
-def getTitle(info: str) -> str:
-    return info.split('\n')[1]
-
-
 if __name__ == "__main__":
     info = getInfo()
     print(info)
@@ -0,0 +1,59 @@
+from typing import Dict
+
+from AppKit import NSRunningApplication
+from ApplicationServices import (
+    AXUIElementCopyAttributeValue,
+    AXUIElementCreateSystemWide,
+    AXUIElementGetPid,
+    kAXErrorSuccess,
+    kAXFocusedApplicationAttribute,
+    kAXFocusedWindowAttribute,
+    kAXTitleAttribute,
+)
+
+# the system-wide element can be reused for the lifetime of the process
+system_element = None
+
+
+def getInfo() -> Dict[str, str]:
+    """
+    Reads the focused application and window title directly through the
+    Accessibility API, avoiding the AppleScript compile/dispatch and the
+    AppleEvents round-trip of the other macOS strategies.
+    """
+    global system_element
+    if system_element is None:
+        system_element = AXUIElementCreateSystemWide()
+
+    err, app_element = AXUIElementCopyAttributeValue(
+        system_element, kAXFocusedApplicationAttribute, None
+    )
+    if err != kAXErrorSuccess:
+        # commonly means missing accessibility permissions
+        raise Exception(f"unable to get focused application (AXError {err})")
+
+    app = ""
+    err, pid = AXUIElementGetPid(app_element, None)
+    if err == kAXErrorSuccess:
+        running_app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+        if running_app is not None:
+            app = running_app.localizedName() or ""
+
+    # a focused app without a focused window happens e.g. right after app
+    # switches, so treat it as an empty title rather than an error
+    title = ""
+    err, window_element = AXUIElementCopyAttributeValue(
+        app_element, kAXFocusedWindowAttribute, None
+    )
+    if err == kAXErrorSuccess:
+        err, title_value = AXUIElementCopyAttributeValue(
+            window_element, kAXTitleAttribute, None
+        )
+        if err == kAXErrorSuccess and title_value is not None:
+            title = str(title_value)
+
+    return {"app": app, "title": title}
+
+
+if __name__ == "__main__":
+    print(getInfo())
@@ -9,7 +9,9 @@ script = None
 
 def compileScript():
     """
-    Compiles the JXA script and caches the result.
+    Loads the pre-compiled JXA script if available (built with osacompile,
+    see `make build-jxa`), otherwise compiles it from source. Either way
+    the result is cached.
 
     Resources:
      - https://stackoverflow.com/questions/44209057/how-can-i-run-jxa-from-swift
@@ -21,17 +23,31 @@ def compileScript():
     if script:
         return script
 
+    from Foundation import NSURL
     from OSAKit import OSAScript, OSALanguage
 
-    scriptPath = os.path.join(
-        os.path.dirname(os.path.realpath(__file__)), "printAppStatus.jxa"
-    )
+    basedir = os.path.dirname(os.path.realpath(__file__))
+
+    # packaged builds ship a pre-compiled script, skipping the JS -> bytecode
+    # compile step (and its first-call latency spike) entirely
+    compiledPath = os.path.join(basedir, "printAppStatus.scpt")
+    if os.path.exists(compiledPath):
+        compiled, err = OSAScript.alloc().initWithContentsOfURL_error_(
+            NSURL.fileURLWithPath_(compiledPath), None
+        )
+        if compiled is not None:
+            script = compiled
+            return script
+        logger.warning(f"failed to load pre-compiled jxa script, compiling from source: {err}")
+
+    # dev checkouts don't have the compiled artifact, compile from source
+    scriptPath = os.path.join(basedir, "printAppStatus.jxa")
     with open(scriptPath) as f:
         scriptContents = f.read()
 
-        # remove shebang line
-        if scriptContents.split("\n")[0].startswith("#"):
-            scriptContents = "\n".join(scriptContents.split("\n")[1:])
+    # remove the shebang line, without splitting/rejoining the whole file
+    if scriptContents.startswith("#"):
+        scriptContents = scriptContents.partition("\n")[2]
 
     script = OSAScript.alloc().initWithSource_language_(
         scriptContents, OSALanguage.languageForName_("JavaScript")
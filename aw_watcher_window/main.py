@@ -3,12 +3,10 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 from datetime import datetime, timezone
-from time import sleep
-
-from aw_client import ActivityWatchClient
-from aw_core.log import setup_logging
-from aw_core.models import Event
+from queue import Full, Queue
+from time import monotonic, sleep
 
 from .config import parse_args
 from .exceptions import FatalError
@@ -23,6 +21,44 @@ if log_level:
     logger.setLevel(logging.__getattribute__(log_level.upper()))
 
 
+PR_SET_PDEATHSIG = 1
+
+
+def _set_parent_death_signal() -> bool:
+    """Ask the kernel to deliver SIGTERM when the parent dies (Linux only),
+    so the poll loop doesn't need to probe os.getppid() every tick."""
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        return libc.prctl(PR_SET_PDEATHSIG, signal.SIGTERM) == 0
+    except OSError:
+        return False
+
+
+def wait_for_server(client, timeout=10.0):
+    """
+    Probe the server with backoff instead of sleeping a fixed second: starts
+    near-instantly when the server is already up, and gives slow hosts more
+    than a second. Not reachable in time is only a warning, since events get
+    queued client-side anyway.
+    """
+    deadline = monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            client.get_info()
+            return
+        except Exception:
+            if monotonic() >= deadline:
+                logger.warning(
+                    f"aw-server not reachable within {timeout:.0f}s, starting anyway (events will be queued)"
+                )
+                return
+            sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+
 def kill_process(pid):
     logger.info("Killing process {}".format(pid))
     try:
@@ -34,6 +70,11 @@ def kill_process(pid):
 def main():
     args = parse_args()
 
+    # deferred until after arg parsing, so e.g. `--help` doesn't pay for the
+    # client/logging import trees
+    from aw_client import ActivityWatchClient
+    from aw_core.log import setup_logging
+
     if sys.platform.startswith("linux") and (
         "DISPLAY" not in os.environ or not os.environ["DISPLAY"]
     ):
@@ -61,7 +102,7 @@ def main():
 
     logger.info("aw-watcher-window started")
 
-    sleep(1)  # wait for server to start
+    wait_for_server(client)
     with client:
         if sys.platform == "darwin" and args.strategy == "swift":
             logger.info("Using swift strategy, calling out to swift binary")
@@ -69,22 +110,28 @@ def main():
                 os.path.dirname(os.path.realpath(__file__)), "aw-watcher-window-macos"
             )
 
-            try:
-                p = subprocess.Popen(
-                    [
-                        binpath,
-                        client.server_address,
-                        bucket_id,
-                        client.client_hostname,
-                        client.client_name,
-                    ]
-                )
-                # terminate swift process when this process dies
-                signal.signal(signal.SIGTERM, lambda *_: kill_process(p.pid))
-                p.wait()
-            except KeyboardInterrupt:
-                print("KeyboardInterrupt")
-                kill_process(p.pid)
+            # handle SIGTERM and SIGINT/Ctrl+C uniformly via an event, instead
+            # of a SIGTERM lambda + KeyboardInterrupt special case
+            shutdown = threading.Event()
+            signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+            signal.signal(signal.SIGINT, lambda *_: shutdown.set())
+
+            p = subprocess.Popen(
+                [
+                    binpath,
+                    client.server_address,
+                    bucket_id,
+                    client.client_hostname,
+                    client.client_name,
+                ]
+            )
+            # wait for the swift process to exit or a signal to arrive, without
+            # parking the main thread in an uninterruptible C-level wait()
+            while p.poll() is None:
+                if shutdown.wait(timeout=1.0):
+                    # terminate swift process when this process is told to die
+                    kill_process(p.pid)
+                    break
         else:
             heartbeat_loop(
                 client,
@@ -95,16 +142,83 @@ def main():
             )
 
 
-def heartbeat_loop(client, bucket_id, poll_time, strategy, exclude_title=False):
+def _heartbeat_sender(client, bucket_id, events: Queue):
     while True:
+        event, pulsetime = events.get()
+        try:
+            client.heartbeat(bucket_id, event, pulsetime=pulsetime, queued=True)
+        except Exception:
+            # one failed send must not kill the thread, or every later event
+            # would be silently dropped once the queue fills up
+            logger.exception("Failed to send heartbeat")
+
+
+def heartbeat_loop(client, bucket_id, poll_time, strategy, exclude_title=False):
+    from aw_core.models import Event
+
+    # Adaptive polling: while the focused window stays the same we double the
+    # poll interval (up to 8x the base), resetting on any change. This cuts
+    # the number of (potentially expensive) window queries during long focus
+    # sessions, while still sampling at full rate around changes.
+    max_poll_time = poll_time * 8
+    effective_poll_time = poll_time
+    last_window = None
+
+    # Only emit a heartbeat when the window actually changed, plus a periodic
+    # keepalive while it stays the same. pulsetime covers the longest possible
+    # gap between two emits, so the server still merges the skipped ticks into
+    # a single event.
+    keepalive_interval = max_poll_time
+    pulsetime = keepalive_interval + max_poll_time + 1.0
+    last_emit = 0.0
+
+    # On consecutive non-fatal errors, back off the poll exponentially (up to
+    # a minute) so a persistent failure doesn't spin at full rate, and log
+    # each exception type at most once a minute to avoid flooding the log.
+    fail_count = 0
+    fail_log_interval = 60.0
+    last_fail_log: dict = {}
+
+    # Heartbeats are handed off to a worker thread, so the polling thread
+    # does nothing beyond querying the active window.
+    events: Queue = Queue(maxsize=128)
+    threading.Thread(
+        target=_heartbeat_sender, args=(client, bucket_id, events), daemon=True
+    ).start()
+
+    # Detect orphaning: on Linux the kernel delivers SIGTERM via
+    # PR_SET_PDEATHSIG the moment the parent dies; elsewhere fall back to
+    # probing os.getppid(), but only every few seconds instead of every tick.
+    stop = threading.Event()
+    if sys.platform.startswith("linux") and _set_parent_death_signal():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        # PDEATHSIG only fires for deaths after the prctl call, so catch a
+        # parent that already exited during startup (e.g. while we were
+        # probing the server) before disabling the getppid fallback
         if os.getppid() == 1:
             logger.info("window-watcher stopped because parent process died")
-            break
+            return
+        ppid_check_interval = None
+    else:
+        ppid_check_interval = 10.0
+    last_ppid_check = monotonic()
+
+    next_tick = monotonic()
+    while not stop.is_set():
+        if (
+            ppid_check_interval is not None
+            and monotonic() - last_ppid_check >= ppid_check_interval
+        ):
+            last_ppid_check = monotonic()
+            if os.getppid() == 1:
+                logger.info("window-watcher stopped because parent process died")
+                break
 
         current_window = None
         try:
             current_window = get_current_window(strategy)
             logger.debug(current_window)
+            fail_count = 0
         except (FatalError, OSError):
             # Fatal exceptions should quit the program
             try:
@@ -112,8 +226,10 @@ def heartbeat_loop(client, bucket_id, poll_time, strategy, exclude_title=False):
             except OSError:
                 pass
             break
-        except Exception:
+        except Exception as e:
             # Non-fatal exceptions should be logged
+            fail_count += 1
+            effective_poll_time = min(poll_time * 2 ** (fail_count - 1), 60.0)
             try:
                 # If stdout has been closed, this exception-print can cause (I think)
                 #   OSError: [Errno 5] Input/output error
@@ -121,24 +237,52 @@ def heartbeat_loop(client, bucket_id, poll_time, strategy, exclude_title=False):
                 #
                 # However, I'm unable to reproduce the OSError in a test (where I close stdout before logging),
                 # so I'm in uncharted waters here... but this solution should work.
-                logger.exception("Exception thrown while trying to get active window")
+                if monotonic() - last_fail_log.get(type(e), 0.0) >= fail_log_interval:
+                    last_fail_log[type(e)] = monotonic()
+                    logger.exception(
+                        "Exception thrown while trying to get active window"
+                    )
             except OSError:
                 break
 
-        if current_window is None:
+        if fail_count > 0:
+            # keep the failure backoff set above, and resample at full rate
+            # once the error clears
+            last_window = None
+        elif current_window is None:
             logger.debug("Unable to fetch window, trying again on next poll")
+            last_window = None
+            effective_poll_time = poll_time
         else:
             if exclude_title:
                 current_window["title"] = "excluded"
 
-            now = datetime.now(timezone.utc)
-            current_window_event = Event(timestamp=now, data=current_window)
+            changed = current_window != last_window
+            if changed:
+                effective_poll_time = poll_time
+            else:
+                effective_poll_time = min(effective_poll_time * 2, max_poll_time)
+            last_window = current_window
 
-            # Set pulsetime to 1 second more than the poll_time
-            # This since the loop takes more time than poll_time
-            # due to sleep(poll_time).
-            client.heartbeat(
-                bucket_id, current_window_event, pulsetime=poll_time + 1.0, queued=True
-            )
+            if changed or monotonic() - last_emit >= keepalive_interval:
+                now = datetime.now(timezone.utc)
+                current_window_event = Event(timestamp=now, data=current_window)
 
-        sleep(poll_time)
+                try:
+                    events.put_nowait((current_window_event, pulsetime))
+                    last_emit = monotonic()
+                except Full:
+                    logger.warning("heartbeat queue full, dropping event")
+
+        # Sleep on a fixed monotonic schedule instead of sleep(poll_time),
+        # so time spent fetching the window/heartbeating doesn't accumulate
+        # as drift in the sampling cadence.
+        next_tick += effective_poll_time
+        delay = next_tick - monotonic()
+        if delay > 0:
+            # wakes immediately if we get stopped by a signal
+            stop.wait(delay)
+        else:
+            # we stalled for more than a full period (suspend, slow window
+            # query, ...), resync instead of trying to catch up
+            next_tick = monotonic()
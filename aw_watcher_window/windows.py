@@ -1,23 +1,132 @@
 from typing import Optional
 
+import ctypes
+import logging
 import os
+import threading
 import time
+from collections import OrderedDict
+from ctypes import wintypes
 
 import win32gui
-import win32api
 import win32process
 
-def get_app_path(hwnd) -> Optional[str]:
-    """Get application path given hwnd."""
-    path = None
+logger = logging.getLogger(__name__)
 
-    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-    process = win32api.OpenProcess(0x0400, False, pid) # PROCESS_QUERY_INFORMATION = 0x0400
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+# the Windows-only ctypes attributes don't exist when mypy runs on other
+# platforms (the CI typecheck job runs on Linux), hence the targeted ignores
+WinEventProcType = ctypes.WINFUNCTYPE(  # type: ignore[attr-defined]
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+
+class ForegroundWatcher:
+    """Tracks the foreground window with SetWinEventHook(EVENT_SYSTEM_FOREGROUND),
+    so polls read a cached handle instead of querying the system every tick."""
+
+    def __init__(self) -> None:
+        self._hwnd: Optional[int] = None
+        self._hook = None
+        self._started = threading.Event()
+        # keep a reference to the callback so it doesn't get garbage collected
+        self._proc = WinEventProcType(self._callback)
+
+    @property
+    def hwnd(self) -> Optional[int]:
+        return self._hwnd
+
+    def _callback(self, hook, event, hwnd, id_object, id_child, thread, timestamp):
+        self._hwnd = hwnd
+
+    def _run(self) -> None:
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        self._hook = user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND,
+            EVENT_SYSTEM_FOREGROUND,
+            0,
+            self._proc,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT,
+        )
+        self._started.set()
+        if not self._hook:
+            return
+        # hook callbacks are delivered through the message queue, so pump it
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) != 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+    def start(self) -> bool:
+        threading.Thread(target=self._run, daemon=True).start()
+        self._started.wait(timeout=5.0)
+        if not self._hook:
+            logger.warning("SetWinEventHook failed, falling back to polling")
+            return False
+        # seed with the current foreground window, since the hook only fires
+        # on the next focus change
+        self._hwnd = win32gui.GetForegroundWindow()
+        return True
+
+
+_foreground_watcher: Optional[ForegroundWatcher] = None
+_hook_failed = False
+
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+_path_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_PATH_CACHE_MAXSIZE = 1024
+
+
+def _query_process_image_path(pid) -> Optional[str]:
+    """Get the executable path of a process via QueryFullProcessImageNameW,
+    which is cheaper than GetModuleFileNameEx and only needs the
+    PROCESS_QUERY_LIMITED_INFORMATION access right."""
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
 
     try:
-        path = win32process.GetModuleFileNameEx(process, 0)
+        size = wintypes.DWORD(4096)
+        buf = ctypes.create_unicode_buffer(size.value)
+        if not kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+        return buf.value
     finally:
-        win32api.CloseHandle(process)
+        kernel32.CloseHandle(handle)
+
+
+def get_app_path(hwnd) -> Optional[str]:
+    """Get application path given hwnd."""
+    # GetWindowThreadProcessId is cheap; keying the cache on (hwnd, pid)
+    # means a recycled pid only yields a stale path if the window handle
+    # was recycled along with it
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    key = (hwnd, pid)
+
+    path = _path_cache.get(key)
+    if path is not None:
+        _path_cache.move_to_end(key)
+        return path
+
+    path = _query_process_image_path(pid)
+    if path is not None:
+        _path_cache[key] = path
+        if len(_path_cache) > _PATH_CACHE_MAXSIZE:
+            _path_cache.popitem(last=False)
 
     return path
 
@@ -34,6 +143,18 @@ def get_window_title(hwnd):
     return win32gui.GetWindowText(hwnd)
 
 def get_active_window_handle():
+    global _foreground_watcher, _hook_failed
+
+    if _foreground_watcher is None and not _hook_failed:
+        watcher = ForegroundWatcher()
+        if watcher.start():
+            _foreground_watcher = watcher
+        else:
+            _hook_failed = True
+
+    if _foreground_watcher is not None and _foreground_watcher.hwnd:
+        return _foreground_watcher.hwnd
+
     hwnd = win32gui.GetForegroundWindow()
     return hwnd
 